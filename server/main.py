@@ -29,7 +29,7 @@ from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.service_switcher import ServiceSwitcher, ServiceSwitcherStrategyManual
 from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.processors.frameworks.rtvi import RTVIObserver, RTVIProcessor
+from pipecat.processors.frameworks.rtvi import RTVIClientMessage, RTVIObserver, RTVIProcessor
 from pipecat.services.llm_service import LLMService
 from pipecat.services.stt_service import STTService
 from pipecat.transports.base_transport import TransportParams
@@ -48,6 +48,7 @@ from config.settings import Settings
 from processors.client_manager import ClientConnectionManager
 from processors.configuration import ConfigurationHandler
 from processors.context_manager import DictationContextManager
+from processors.response_cache import DictationResponseCache
 from processors.turn_controller import TurnController
 from protocol.messages import (
     SetLLMProviderMessage,
@@ -210,6 +211,10 @@ async def run_pipeline(
         strategy_type=ServiceSwitcherStrategyManual,
     )
 
+    # Response cache short-circuits the LLM when the same dictation is repeated
+    response_cache = DictationResponseCache()
+    response_cache.watch_llm_services(llm_service_list)
+
     # RTVIProcessor handles the RTVI protocol (client messages, server responses)
     rtvi_processor = RTVIProcessor()
 
@@ -222,25 +227,24 @@ async def run_pipeline(
         stt_services=stt_services,
         llm_services=llm_services,
         settings=services.settings,
+        response_cache=response_cache,
     )
 
     # Register event handler for client messages
     @rtvi_processor.event_handler("on_client_message")
-    async def on_client_message(processor: RTVIProcessor, message: Any) -> None:
+    async def on_client_message(processor: RTVIProcessor, message: RTVIClientMessage) -> None:
         """Handle RTVI client messages for configuration and recording control."""
         _ = processor  # Unused, required by event handler signature
 
-        # Parse the raw RTVI message into a typed Pydantic model
-        # This converts the message.type + message.data structure into a discriminated union
-        raw_data = {
-            "type": message.type if hasattr(message, "type") else None,
-            "data": message.data if hasattr(message, "data") else {},
-        }
-        if raw_data["type"] is None:
+        # RTVIProcessor always delivers an RTVIClientMessage, so read the fields
+        # directly and skip messages without a type before doing any parsing
+        if not message.type:
             return
 
+        # Parse the raw RTVI message into a typed Pydantic model
+        # This converts the message.type + message.data structure into a discriminated union
         # Use forward-compatible parser (never returns None)
-        parsed = parse_client_message(raw_data)
+        parsed = parse_client_message({"type": message.type, "data": message.data})
 
         # Handle the typed message with exhaustive pattern matching
         match parsed:
@@ -262,7 +266,9 @@ async def run_pipeline(
             stt_switcher,
             turn_controller,  # Controls turn boundaries, passes transcriptions through
             context_manager.user_aggregator(),  # Collects transcriptions, emits LLMContextFrame
+            response_cache.lookup(),  # Skips the LLM for previously cleaned dictations
             llm_switcher,
+            response_cache.store(),  # Caches LLM responses, emits cached responses on hits
             context_manager.assistant_aggregator(),  # Collects LLM responses
             transport.output(),
         ]
@@ -7,11 +7,13 @@ from processors.llm import (
     MAIN_PROMPT_DEFAULT,
     combine_prompt_sections,
 )
+from processors.response_cache import DictationResponseCache
 
 __all__ = [
     "ADVANCED_PROMPT_DEFAULT",
     "DICTIONARY_PROMPT_DEFAULT",
     "MAIN_PROMPT_DEFAULT",
     "DictationContextManager",
+    "DictationResponseCache",
     "combine_prompt_sections",
 ]
@@ -44,6 +44,7 @@ if TYPE_CHECKING:
     from pipecat.services.llm_service import LLMService
 
     from config.settings import Settings
+    from processors.response_cache import DictationResponseCache
 
 
 class ConfigurationHandler:
@@ -70,6 +71,7 @@ class ConfigurationHandler:
         stt_services: dict[STTProviderId, STTService],
         llm_services: dict[LLMProviderId, LLMService],
         settings: Settings,
+        response_cache: DictationResponseCache,
     ) -> None:
         """Initialize the configuration handler.
 
@@ -80,6 +82,7 @@ class ConfigurationHandler:
             stt_services: Dictionary mapping STT provider IDs to services
             llm_services: Dictionary mapping LLM provider IDs to services
             settings: Application settings for auto provider configuration
+            response_cache: Response cache to clear when the LLM provider changes
         """
         self._rtvi = rtvi_processor
         self._stt_switcher = stt_switcher
@@ -87,6 +90,7 @@ class ConfigurationHandler:
         self._stt_services = stt_services
         self._llm_services = llm_services
         self._settings = settings
+        self._response_cache = response_cache
 
     async def handle_config_message(self, message: ConfigMessage) -> None:
         """Handle a typed configuration message.
@@ -195,6 +199,8 @@ class ConfigurationHandler:
             ManuallySwitchServiceFrame(service=service),
             FrameDirection.DOWNSTREAM,
         )
+        # Cached responses came from the previous model; don't replay them
+        self._response_cache.clear()
 
         logger.success(f"Switched LLM provider to: {provider_id.value}")
         # Echo back the original selection - client sent it, server validated it works
@@ -52,6 +52,10 @@ class DictationContextManager:
         self._dictionary_enabled: bool = False
         self._dictionary_custom: str | None = None
 
+        # System message is rebuilt only when prompt sections change, so every
+        # recording sends a byte-identical prefix (keeps provider prompt caching hot)
+        self._system_message = self._build_system_message()
+
         # Create shared context (will be reset before each recording)
         self._context = LLMContext()
 
@@ -77,6 +81,15 @@ class DictationContextManager:
             dictionary_custom=self._dictionary_custom,
         )
 
+    @property
+    def uses_default_main_prompt(self) -> bool:
+        """Whether the built-in main prompt (which removes filler words) is active."""
+        return not self._main_custom
+
+    def _build_system_message(self) -> ChatCompletionSystemMessageParam:
+        """Build the system message from the current prompt sections."""
+        return ChatCompletionSystemMessageParam(role="system", content=self.system_prompt)
+
     def set_prompt_sections(
         self,
         main_custom: str | None = None,
@@ -102,6 +115,7 @@ class DictationContextManager:
         self._advanced_custom = advanced_custom
         self._dictionary_enabled = dictionary_enabled
         self._dictionary_custom = dictionary_custom
+        self._system_message = self._build_system_message()
         logger.info("Formatting prompt sections updated")
 
     def reset_context_for_new_recording(self) -> None:
@@ -110,10 +124,11 @@ class DictationContextManager:
         Called by TranscriptionBufferProcessor when recording starts.
         Clears all previous messages and sets the system prompt.
         This ensures each dictation is independent with no conversation history.
+
+        The cached system message is reused rather than recombined; it must not be
+        mutated so the prompt prefix stays identical across recordings.
         """
-        self._context.set_messages(
-            [ChatCompletionSystemMessageParam(role="system", content=self.system_prompt)]
-        )
+        self._context.set_messages([self._system_message])
         logger.debug("Context reset for new recording")
 
     def user_aggregator(self) -> LLMUserAggregator:
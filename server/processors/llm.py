@@ -4,8 +4,12 @@ This module contains the three-section prompt system:
 - Main prompt: Core dictation formatting rules (always enabled)
 - Advanced prompt: Backtrack corrections and list formatting
 - Dictionary prompt: Personal word mappings and technical terms
+
+It also provides a deterministic filler check so transcriptions with nothing
+to format can skip the LLM entirely.
 """
 
+import re
 from typing import Final
 
 # Main prompt section - Core rules, punctuation, new lines
@@ -273,6 +277,24 @@ After each correction, verify that the replacement was applied accurately and th
 - Tauri"""
 
 
+# Matches text made up only of the hesitation fillers the main prompt removes (um, uh, err,
+# erm) and punctuation.
+# Words like "like" or "actually" are deliberately excluded: they can carry meaning and
+# "actually" drives backtrack corrections in the advanced prompt.
+FILLER_ONLY_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"[\W_]*(?:(?:u+m+|u+h+|e+r+m*)\b[\W_]*)+",
+    re.IGNORECASE,
+)
+
+
+def is_filler_only(text: str) -> bool:
+    """Check whether a transcription contains nothing but hesitation fillers.
+
+    The LLM would reduce such text to an empty result, so callers can skip it.
+    """
+    return FILLER_ONLY_PATTERN.fullmatch(text) is not None
+
+
 def combine_prompt_sections(
     main_custom: str | None,
     advanced_enabled: bool,
@@ -0,0 +1,267 @@
+"""Exact-match response cache for dictation cleanup.
+
+Re-dictating the same phrase with the same prompt yields the same cleaned text,
+so there is no need to pay for another LLM round-trip. The cache is split into
+two processors that share state and sit on either side of the LLM switcher:
+- ResponseCacheLookup: Intercepts LLMContextFrame before the LLM and, on a hit,
+  replaces it with a CachedLLMResponseFrame that the LLM services pass through
+- ResponseCacheStore: Records LLM responses on a miss and expands
+  CachedLLMResponseFrame into response frames on a hit
+
+On a hit the store emits the same LLMFullResponseStartFrame/LLMTextFrame/
+LLMFullResponseEndFrame sequence an LLM would, so the assistant aggregator and
+RTVIObserver deliver it to the client unchanged. Because the cached response
+travels through the LLM switcher as a regular frame, it stays queued behind any
+response the LLM is still streaming.
+
+Failed responses must never be replayed. LLM services push LLMFullResponseEndFrame
+even when the completion fails, before (or instead of) reporting the failure, so
+the store cannot tell a truncated stream from a complete one. Instead the lookup
+remembers the key it last sent to the LLM and discards it when an LLM service
+reports an ErrorFrame or a completion timeout, whichever order those arrive in.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Final
+
+from pipecat.frames.frames import (
+    DataFrame,
+    ErrorFrame,
+    Frame,
+    LLMContextFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+)
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.llm_service import LLMService
+
+from utils.logger import logger
+
+# Maximum number of cached responses per connection
+DEFAULT_RESPONSE_CACHE_SIZE: Final[int] = 256
+
+
+@dataclass
+class CachedLLMResponseFrame(DataFrame):
+    """A cached LLM response on its way from the lookup to the store.
+
+    Parameters:
+        text: The cached response text.
+    """
+
+    text: str
+
+
+def build_cache_key(context: LLMContext) -> str | None:
+    """Build a cache key from the context messages.
+
+    The system prompt is part of the key, so changing prompt sections naturally
+    misses the cache. User text is normalized (stripped and casefolded) so minor
+    transcription differences in case or surrounding whitespace still hit.
+
+    Returns:
+        The cache key, or None if the context contains non-text messages that
+        cannot be keyed reliably.
+    """
+    parts: list[str] = []
+    for message in context.get_messages():
+        if not isinstance(message, dict):
+            return None
+        role = message.get("role")
+        content = message.get("content")
+        if not isinstance(content, str):
+            return None
+        if role == "user":
+            content = content.strip().casefold()
+        parts.append(f"{role}\x00{content}")
+    return "\x1e".join(parts) if parts else None
+
+
+class DictationResponseCache:
+    """LRU cache of cleaned dictation text keyed on the LLM context.
+
+    Provides the lookup and store processors for pipeline placement, similar to
+    how DictationContextManager exposes its aggregator pair.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_RESPONSE_CACHE_SIZE) -> None:
+        """Initialize the response cache.
+
+        Args:
+            max_size: Maximum number of responses to keep before evicting the
+                      least recently used entry.
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        # Keys of contexts sent to the LLM, in order, awaiting their response
+        self._pending_keys: deque[str | None] = deque()
+        # Keys whose latest LLM response failed; put() ignores them until re-sent.
+        # Bounded like the entries, since failed keys may never be sent again.
+        self._discarded_keys: OrderedDict[str, None] = OrderedDict()
+        self._lookup = ResponseCacheLookup(self)
+        self._store = ResponseCacheStore(self)
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response and mark it as recently used."""
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """Cache a response, evicting the least recently used entry if full.
+
+        Responses for keys discarded after a failure are ignored.
+        """
+        if key in self._discarded_keys:
+            return
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Drop a failed response, whether or not the store already cached it."""
+        self._entries.pop(key, None)
+        self._discarded_keys[key] = None
+        self._discarded_keys.move_to_end(key)
+        if len(self._discarded_keys) > self._max_size:
+            self._discarded_keys.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses (e.g., after switching LLM provider)."""
+        self._entries.clear()
+        logger.debug("Response cache cleared")
+
+    def mark_pending(self, key: str | None) -> None:
+        """Record the key of a context that was sent to the LLM."""
+        if key is not None:
+            self._discarded_keys.pop(key, None)
+        self._pending_keys.append(key)
+
+    def take_pending(self) -> str | None:
+        """Take the key of the oldest context still awaiting its LLM response."""
+        return self._pending_keys.popleft() if self._pending_keys else None
+
+    def watch_llm_services(self, llm_services: Iterable[LLMService]) -> None:
+        """Discard the in-flight response when an LLM completion times out.
+
+        Some services (e.g., OpenAI-compatible ones on httpx timeouts) only raise
+        on_completion_timeout and push no ErrorFrame.
+        """
+        for service in llm_services:
+            service.add_event_handler("on_completion_timeout", self._on_completion_timeout)
+
+    async def _on_completion_timeout(self, service: LLMService) -> None:
+        """Handle an LLM completion timeout."""
+        logger.warning(f"{service} completion timed out, not caching its response")
+        self._lookup.discard_last_response()
+
+    def lookup(self) -> ResponseCacheLookup:
+        """Get the lookup processor (place immediately before the LLM)."""
+        return self._lookup
+
+    def store(self) -> ResponseCacheStore:
+        """Get the store processor (place immediately after the LLM)."""
+        return self._store
+
+
+class ResponseCacheLookup(FrameProcessor):
+    """Serves cached responses for LLMContextFrames that were already cleaned."""
+
+    __slots__ = ("_cache", "_last_sent_key")
+
+    def __init__(self, cache: DictationResponseCache, **kwargs: Any) -> None:
+        """Initialize the lookup processor.
+
+        Args:
+            cache: The shared response cache.
+        """
+        super().__init__(**kwargs)
+        self._cache = cache
+        # Key of the context most recently sent to the LLM
+        self._last_sent_key: str | None = None
+
+    def discard_last_response(self) -> None:
+        """Discard the response to the context most recently sent to the LLM."""
+        if self._last_sent_key is not None:
+            self._cache.discard(self._last_sent_key)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection) -> None:
+        """Answer LLMContextFrames from the cache when possible."""
+        await super().process_frame(frame, direction)
+
+        match frame:
+            case LLMContextFrame(context=context) if direction == FrameDirection.DOWNSTREAM:
+                key = build_cache_key(context)
+                cached = self._cache.get(key) if key is not None else None
+                if cached is not None:
+                    logger.info("Response cache hit, skipping LLM")
+                    # Sent through the LLM (which passes it along) rather than around
+                    # it, so it can't overtake a response that is still streaming
+                    await self.push_frame(CachedLLMResponseFrame(text=cached), direction)
+                    return
+                self._cache.mark_pending(key)
+                self._last_sent_key = key
+                await self.push_frame(frame, direction)
+
+            case ErrorFrame(processor=LLMService()) if direction == FrameDirection.UPSTREAM:
+                # The LLM failed; don't cache (or keep) whatever partial response it produced.
+                # Errors from other processors say nothing about the LLM response.
+                self.discard_last_response()
+                await self.push_frame(frame, direction)
+
+            case _:
+                await self.push_frame(frame, direction)
+
+
+class ResponseCacheStore(FrameProcessor):
+    """Records LLM responses and expands cached responses into response frames."""
+
+    __slots__ = ("_cache", "_current_key", "_current_parts")
+
+    def __init__(self, cache: DictationResponseCache, **kwargs: Any) -> None:
+        """Initialize the store processor.
+
+        Args:
+            cache: The shared response cache.
+        """
+        super().__init__(**kwargs)
+        self._cache = cache
+        self._current_key: str | None = None
+        self._current_parts: list[str] = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection) -> None:
+        """Accumulate LLM responses and cache them when complete."""
+        await super().process_frame(frame, direction)
+
+        match frame:
+            case CachedLLMResponseFrame(text=text):
+                # Emit the cached response as if it had been produced by the LLM
+                await self.push_frame(LLMFullResponseStartFrame())
+                await self.push_frame(LLMTextFrame(text=text))
+                await self.push_frame(LLMFullResponseEndFrame())
+                return
+
+            case LLMFullResponseStartFrame():
+                self._current_key = self._cache.take_pending()
+                self._current_parts.clear()
+
+            case LLMTextFrame(text=text) if self._current_key is not None:
+                self._current_parts.append(text)
+
+            case LLMFullResponseEndFrame() if self._current_key is not None:
+                response = "".join(self._current_parts)
+                # isspace() checks for content without allocating a stripped copy
+                if response and not response.isspace():
+                    self._cache.put(self._current_key, response)
+                self._current_key = None
+                self._current_parts.clear()
+
+        await self.push_frame(frame, direction)
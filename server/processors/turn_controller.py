@@ -34,6 +34,7 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIServerMessageFrame
 
+from processors.llm import is_filler_only
 from protocol.messages import RecordingCompleteMessage
 from utils.logger import logger
 
@@ -43,27 +44,33 @@ if TYPE_CHECKING:
 # Default timeout for waiting for STT transcriptions (can be overridden at runtime)
 DEFAULT_TRANSCRIPTION_WAIT_TIMEOUT_SECONDS: Final[float] = 0.5
 
+# Empty-recording response never changes, so serialize it once instead of per send.
+# Treated as read-only: RTVIServerMessageFrame only wraps it for serialization.
+EMPTY_RECORDING_COMPLETE_DATA: Final[dict[str, Any]] = RecordingCompleteMessage(
+    hasContent=False
+).model_dump()
+
 
 # =============================================================================
 # State Machine Types
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdleState:
     """Not recording. Waiting for start-recording message."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordingState:
     """Actively recording. Transcriptions pass through to aggregator."""
 
     has_content: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaitingForSTTState:
     """Stop-recording received, waiting for VAD to signal speech has stopped.
 
@@ -76,7 +83,7 @@ class WaitingForSTTState:
     direction: FrameDirection
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DrainingState:
     """Speech stopped, draining any remaining transcriptions from STT.
 
@@ -107,6 +114,17 @@ class TurnController(FrameProcessor):
     states unrepresentable.
     """
 
+    # FrameProcessor instances still carry a __dict__, but slotted attributes read
+    # on every frame skip the instance dict lookup
+    __slots__ = (
+        "_context_manager",
+        "_draining_event",
+        "_draining_task",
+        "_state",
+        "_timeout_task",
+        "_transcription_wait_timeout",
+    )
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize the turn controller."""
         super().__init__(**kwargs)
@@ -151,6 +169,19 @@ class TurnController(FrameProcessor):
         self._cancel_draining()
         await super().cleanup()
 
+    def _is_without_content(self, text: str) -> bool:
+        """Check whether a transcription has nothing for the LLM to keep.
+
+        Fillers only count as empty while the default main prompt is active, since
+        that is the prompt that removes them; a custom prompt may keep them.
+        """
+        if text.isspace():
+            return True
+        uses_default_prompt = (
+            self._context_manager is None or self._context_manager.uses_default_main_prompt
+        )
+        return uses_default_prompt and is_filler_only(text)
+
     async def process_frame(self, frame: Frame, direction: FrameDirection) -> None:
         """Process frames using state machine pattern.
 
@@ -164,6 +195,17 @@ class TurnController(FrameProcessor):
                 await self._handle_speech_stopped(direction)
                 await self.push_frame(frame, direction)
 
+            case TranscriptionFrame(text=text) if text and self._is_without_content(text):
+                # Nothing for the LLM to clean up. Dropping it means a recording made
+                # only of whitespace or fillers ends with an empty response and never
+                # calls the LLM.
+                logger.debug("Dropping transcription without content: '{}'", text)
+                match self._state:
+                    case DrainingState():
+                        # STT is still delivering, so extend the drain timer (without
+                        # marking content) in case real words follow
+                        self._draining_event.set()
+
             case TranscriptionFrame(text=text) if text:
                 await self._handle_transcription(frame, direction)
                 # Pass transcriptions through to aggregator during recording states
@@ -271,7 +313,8 @@ class TurnController(FrameProcessor):
         match self._state:
             case RecordingState():
                 self._state = RecordingState(has_content=True)
-                logger.debug(f"Transcription received: '{frame.text}'")
+                # Deferred formatting: skipped entirely unless DEBUG is enabled
+                logger.debug("Transcription received: '{}'", frame.text)
 
             case WaitingForSTTState() as state:
                 self._state = WaitingForSTTState(
@@ -384,5 +427,5 @@ class TurnController(FrameProcessor):
 
     async def _emit_empty_response(self, direction: FrameDirection) -> None:
         """Send an empty response message to the client."""
-        frame = RTVIServerMessageFrame(data=RecordingCompleteMessage(hasContent=False).model_dump())
+        frame = RTVIServerMessageFrame(data=EMPTY_RECORDING_COMPLETE_DATA)
         await self.push_frame(frame, direction)
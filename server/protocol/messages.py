@@ -11,7 +11,7 @@ Message flow:
 """
 
 from enum import StrEnum
-from typing import Annotated, Any, Literal
+from typing import Annotated, Any, Final, Literal, get_args
 
 from loguru import logger
 from pydantic import BaseModel, Field, RootModel, ValidationError
@@ -124,19 +124,39 @@ class UnknownClientMessage(BaseModel):
     raw: dict[str, Any]  # Full original message for debugging
 
 
+# Concrete model for each known "type" discriminator. Resolving the model with a dict
+# lookup lets parse_client_message validate against it directly, instead of going
+# through the ClientMessage union wrapper on every inbound message. Built from the
+# union so a new message type only needs to be added there.
+_CLIENT_MESSAGE_MODELS: Final[dict[str, type[_ClientMessageUnion]]] = {
+    message_type: model
+    for model in get_args(_ClientMessageUnion)
+    for message_type in get_args(model.model_fields["type"].annotation)
+}
+
+
 def parse_client_message(raw: dict[str, Any]) -> _ClientMessageUnion | UnknownClientMessage:
     """Parse client message with forward compatibility.
 
-    Returns UnknownClientMessage for unknown types (never None).
+    Returns UnknownClientMessage for unknown types or invalid payloads (never None).
     This allows exhaustive pattern matching while preserving raw data
     for debugging purposes.
     """
+    message_type = raw.get("type")
+    if not isinstance(message_type, str):
+        logger.debug(f"Client message without a valid type: {message_type!r}")
+        return UnknownClientMessage(type="", raw=raw)
+
+    model = _CLIENT_MESSAGE_MODELS.get(message_type)
+    if model is None:
+        logger.debug(f"Unknown client message type: {message_type}")
+        return UnknownClientMessage(type=message_type, raw=raw)
+
     try:
-        wrapper = ClientMessage.model_validate(raw)
-        return wrapper.root  # Return the actual message, not the wrapper
+        return model.model_validate(raw)
     except ValidationError:
-        logger.debug(f"Unknown client message type: {raw.get('type')}")
-        return UnknownClientMessage(type=raw.get("type", ""), raw=raw)
+        logger.debug(f"Invalid client message payload for type: {message_type}")
+        return UnknownClientMessage(type=message_type, raw=raw)
 
 
 # =============================================================================
@@ -171,7 +171,7 @@ class NVidiaWebSocketSTTService(WebsocketSTTService):
                 self._pending_user_stopped_frame = f
                 self._pending_frame_direction = direction
                 self._start_pending_frame_timeout()
-                self._vad_stopped_time = time.time()
+                self._vad_stopped_time = time.monotonic()
                 await self._send_reset(finalize=True)
                 # Don't pass through yet
 
@@ -187,7 +187,7 @@ class NVidiaWebSocketSTTService(WebsocketSTTService):
                 self._waiting_for_final = True
                 if direction == FrameDirection.UPSTREAM:
                     # Manual stop - hard reset to capture trailing words
-                    self._vad_stopped_time = time.time()
+                    self._vad_stopped_time = time.monotonic()
                     await self._send_reset(finalize=True)
                 else:
                     # Natural VAD silence - soft reset for quick response
@@ -379,8 +379,8 @@ class NVidiaWebSocketSTTService(WebsocketSTTService):
 
         await self.stop_ttfb_metrics()
 
-        timestamp = time_now_iso8601()
-
+        # Timestamps are only formatted for frames that are actually emitted
+        # (final transcripts from soft resets push nothing)
         if is_final:
             if is_hard_reset:
                 # Server handles deduplication - it sends only the delta (new portion)
@@ -390,7 +390,7 @@ class NVidiaWebSocketSTTService(WebsocketSTTService):
                         TranscriptionFrame(
                             text,
                             self._user_id,
-                            timestamp,
+                            time_now_iso8601(),
                             language=None,
                         )
                     )
@@ -398,7 +398,7 @@ class NVidiaWebSocketSTTService(WebsocketSTTService):
 
                     # Emit STT processing time metric
                     if self._vad_stopped_time is not None:
-                        processing_time = time.time() - self._vad_stopped_time
+                        processing_time = time.monotonic() - self._vad_stopped_time
                         metrics_frame = MetricsFrame(
                             data=[
                                 TTFBMetricsData(
@@ -417,7 +417,7 @@ class NVidiaWebSocketSTTService(WebsocketSTTService):
                 InterimTranscriptionFrame(
                     text,
                     self._user_id,
-                    timestamp,
+                    time_now_iso8601(),
                     language=None,
                 )
             )
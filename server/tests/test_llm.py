@@ -1,10 +1,11 @@
-"""Tests for LLM formatting prompt combination logic."""
+"""Tests for LLM formatting prompt combination and filler detection logic."""
 
 from processors.llm import (
     ADVANCED_PROMPT_DEFAULT,
     DICTIONARY_PROMPT_DEFAULT,
     MAIN_PROMPT_DEFAULT,
     combine_prompt_sections,
+    is_filler_only,
 )
 
 
@@ -118,3 +119,39 @@ class TestCombinePromptSections:
         assert MAIN_PROMPT_DEFAULT in result
         assert ADVANCED_PROMPT_DEFAULT in result
         assert DICTIONARY_PROMPT_DEFAULT not in result
+
+
+class TestIsFillerOnly:
+    """Tests for is_filler_only() function."""
+
+    def test_single_filler(self) -> None:
+        """A lone filler word is filler-only."""
+        assert is_filler_only("um")
+
+    def test_fillers_with_punctuation_and_case(self) -> None:
+        """Fillers separated by punctuation and whitespace, in any case, are filler-only."""
+        assert is_filler_only("Umm, uh... er. ")
+        assert is_filler_only("errr erm")
+
+    def test_text_with_content_is_not_filler_only(self) -> None:
+        """Any real word means the transcription needs formatting."""
+        assert not is_filler_only("um I think so")
+
+    def test_words_starting_with_filler_are_not_fillers(self) -> None:
+        """Words like 'umbrella' or 'error' are not mistaken for fillers."""
+        assert not is_filler_only("umbrella")
+        assert not is_filler_only("error")
+
+    def test_meaningful_words_are_not_fillers(self) -> None:
+        """Words that can carry meaning (e.g., 'actually') are left for the LLM."""
+        assert not is_filler_only("actually")
+        assert not is_filler_only("like")
+
+    def test_only_main_prompt_fillers_are_matched(self) -> None:
+        """Hesitations the main prompt doesn't list (e.g., 'hmm') are left for the LLM."""
+        assert not is_filler_only("hmm")
+
+    def test_blank_text_is_not_filler_only(self) -> None:
+        """Empty or whitespace-only text contains no fillers."""
+        assert not is_filler_only("")
+        assert not is_filler_only("  ")
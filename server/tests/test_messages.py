@@ -0,0 +1,67 @@
+"""Tests for client message parsing."""
+
+from typing import get_args
+
+from protocol.messages import (
+    _CLIENT_MESSAGE_MODELS,
+    SetLLMProviderMessage,
+    SetSTTProviderMessage,
+    StartRecordingMessage,
+    StopRecordingMessage,
+    UnknownClientMessage,
+    _ClientMessageUnion,
+    parse_client_message,
+)
+from protocol.providers import AutoProvider, KnownSTTProvider, STTProviderId
+
+
+class TestParseClientMessage:
+    """Tests for parse_client_message() function."""
+
+    def test_recording_messages(self) -> None:
+        """Start and stop recording messages parse to their typed models."""
+        assert isinstance(parse_client_message({"type": "start-recording"}), StartRecordingMessage)
+        assert isinstance(
+            parse_client_message({"type": "stop-recording", "data": None}), StopRecordingMessage
+        )
+
+    def test_set_stt_provider_message(self) -> None:
+        """Provider switching messages parse their nested selection."""
+        result = parse_client_message(
+            {
+                "type": "set-stt-provider",
+                "data": {"provider": {"mode": "known", "providerId": "deepgram"}},
+            }
+        )
+        assert isinstance(result, SetSTTProviderMessage)
+        assert isinstance(result.data.provider, KnownSTTProvider)
+        assert result.data.provider.provider_id == STTProviderId.DEEPGRAM
+
+    def test_set_llm_provider_message(self) -> None:
+        """Auto mode selections are parsed for LLM provider switching."""
+        result = parse_client_message(
+            {"type": "set-llm-provider", "data": {"provider": {"mode": "auto"}}}
+        )
+        assert isinstance(result, SetLLMProviderMessage)
+        assert result.data.provider == AutoProvider(mode="auto")
+
+    def test_unknown_type_preserves_raw(self) -> None:
+        """Unknown message types are returned with the raw message for debugging."""
+        raw = {"type": "future-message", "data": {"x": 1}}
+        result = parse_client_message(raw)
+        assert result == UnknownClientMessage(type="future-message", raw=raw)
+
+    def test_invalid_payload_for_known_type(self) -> None:
+        """A known type with an invalid payload is treated as unknown."""
+        raw = {"type": "set-stt-provider", "data": None}
+        result = parse_client_message(raw)
+        assert result == UnknownClientMessage(type="set-stt-provider", raw=raw)
+
+    def test_missing_type(self) -> None:
+        """A message without a string type is treated as unknown with an empty type."""
+        raw = {"type": None, "data": {}}
+        assert parse_client_message(raw) == UnknownClientMessage(type="", raw=raw)
+
+    def test_every_union_member_is_dispatched(self) -> None:
+        """Each model in the client message union has an entry in the dispatch table."""
+        assert set(_CLIENT_MESSAGE_MODELS.values()) == set(get_args(_ClientMessageUnion))
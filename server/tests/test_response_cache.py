@@ -0,0 +1,311 @@
+"""Tests for the dictation response cache."""
+
+import asyncio
+from collections.abc import Sequence
+
+from pipecat.frames.frames import (
+    ErrorFrame,
+    Frame,
+    LLMContextFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.llm_service import LLMService
+from pipecat.tests.utils import SleepFrame, run_test
+
+from processors.response_cache import DictationResponseCache, build_cache_key
+
+
+def _context(user_text: str, system_prompt: str = "Format the text.") -> LLMContext:
+    return LLMContext(
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_text},
+        ]
+    )
+
+
+class TestBuildCacheKey:
+    """Tests for build_cache_key() function."""
+
+    def test_user_text_is_normalized(self) -> None:
+        """Case and surrounding whitespace in user text do not change the key."""
+        assert build_cache_key(_context("send it to john")) == build_cache_key(
+            _context("  Send it to John ")
+        )
+
+    def test_system_prompt_is_part_of_key(self) -> None:
+        """Changing the prompt produces a different key."""
+        assert build_cache_key(_context("hello", "Prompt A")) != build_cache_key(
+            _context("hello", "Prompt B")
+        )
+
+    def test_non_text_content_is_not_cacheable(self) -> None:
+        """Messages with structured content cannot be keyed."""
+        context = LLMContext(
+            messages=[{"role": "user", "content": [{"type": "text", "text": "hello"}]}]
+        )
+        assert build_cache_key(context) is None
+
+    def test_empty_context_is_not_cacheable(self) -> None:
+        """A context with no messages has no key."""
+        assert build_cache_key(LLMContext()) is None
+
+
+class TestDictationResponseCache:
+    """Tests for DictationResponseCache LRU behavior."""
+
+    def test_get_returns_cached_response(self) -> None:
+        """A stored response is returned for the same key."""
+        cache = DictationResponseCache()
+        cache.put("key", "Cleaned text.")
+        assert cache.get("key") == "Cleaned text."
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The least recently used entry is evicted when the cache is full."""
+        cache = DictationResponseCache(max_size=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", "C")
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
+
+    def test_pending_keys_are_taken_in_order(self) -> None:
+        """Pending keys are matched to LLM responses in arrival order."""
+        cache = DictationResponseCache()
+        cache.mark_pending("first")
+        cache.mark_pending("second")
+        assert cache.take_pending() == "first"
+        assert cache.take_pending() == "second"
+        assert cache.take_pending() is None
+
+
+class FakeLLMService(LLMService):
+    """LLM stand-in that streams a scripted response for each LLMContextFrame.
+
+    Mirrors pipecat's OpenAI-compatible services: the end frame is pushed even when
+    the completion fails, and the failure is reported afterwards.
+    """
+
+    def __init__(
+        self, chunks: list[str], failure: str | None = None, chunk_delay: float = 0.0
+    ) -> None:
+        super().__init__()
+        self.calls = 0
+        self._chunks = chunks
+        self._failure = failure
+        self._chunk_delay = chunk_delay
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection) -> None:
+        await super().process_frame(frame, direction)
+        if not isinstance(frame, LLMContextFrame):
+            await self.push_frame(frame, direction)
+            return
+
+        self.calls += 1
+        await self.push_frame(LLMFullResponseStartFrame())
+        for chunk in self._chunks:
+            await asyncio.sleep(self._chunk_delay)
+            await self.push_frame(LLMTextFrame(text=chunk))
+        await self.push_frame(LLMFullResponseEndFrame())
+        if self._failure == "error":
+            await self.push_error("Completion failed")
+        elif self._failure == "timeout":
+            await self._call_event_handler("on_completion_timeout")
+
+
+class ErrorAfterProcessor(FrameProcessor):
+    """Downstream stand-in (e.g., transport output) that errors after each response."""
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection) -> None:
+        await super().process_frame(frame, direction)
+        if isinstance(frame, LLMFullResponseEndFrame):
+            await self.push_error("Output failed")
+        await self.push_frame(frame, direction)
+
+
+def _run_cache_pipeline(
+    cache: DictationResponseCache,
+    llm: FakeLLMService,
+    *,
+    expected_down_frames: list[type[Frame]],
+    expected_up_frames: list[type[Frame]] | None = None,
+    frames_to_send: list[Frame] | None = None,
+    downstream: list[FrameProcessor] | None = None,
+) -> Sequence[Frame]:
+    cache.watch_llm_services([llm])
+    pipeline = Pipeline([cache.lookup(), llm, cache.store(), *(downstream or [])])
+    down_frames, _ = asyncio.run(
+        run_test(
+            pipeline,
+            frames_to_send=frames_to_send or [LLMContextFrame(context=_context("hello world"))],
+            expected_down_frames=expected_down_frames,
+            expected_up_frames=expected_up_frames,
+        )
+    )
+    return down_frames
+
+
+_RESPONSE_FRAMES: list[type[Frame]] = [
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    LLMFullResponseEndFrame,
+]
+
+
+class TestResponseCacheProcessors:
+    """Tests for the lookup and store processors around the LLM."""
+
+    def test_hit_skips_llm_and_emits_response_frames(self) -> None:
+        """A cached context never reaches the LLM and gets the usual response frames."""
+        cache = DictationResponseCache()
+        key = build_cache_key(_context("hello world"))
+        assert key is not None
+        cache.put(key, "Hello world.")
+        llm = FakeLLMService(["unused"])
+
+        _run_cache_pipeline(cache, llm, expected_down_frames=_RESPONSE_FRAMES)
+
+        assert llm.calls == 0
+
+    def test_hit_waits_for_streaming_response(self) -> None:
+        """A hit behind a slow miss is delivered after the miss's response."""
+        cache = DictationResponseCache()
+        key = build_cache_key(_context("repeat"))
+        assert key is not None
+        cache.put(key, "CACHED")
+        llm = FakeLLMService(["slow-1 ", "slow-2"], chunk_delay=0.05)
+
+        down_frames = _run_cache_pipeline(
+            cache,
+            llm,
+            frames_to_send=[
+                LLMContextFrame(context=_context("new")),
+                LLMContextFrame(context=_context("repeat")),
+            ],
+            expected_down_frames=[
+                LLMFullResponseStartFrame,
+                LLMTextFrame,
+                LLMTextFrame,
+                LLMFullResponseEndFrame,
+                *_RESPONSE_FRAMES,
+            ],
+        )
+
+        texts = [frame.text for frame in down_frames if isinstance(frame, LLMTextFrame)]
+        assert texts == ["slow-1 ", "slow-2", "CACHED"]
+        assert llm.calls == 1
+
+    def test_miss_caches_streamed_response(self) -> None:
+        """A miss is sent to the LLM and its streamed response is cached."""
+        cache = DictationResponseCache()
+        llm = FakeLLMService(["Hello ", "world."])
+
+        _run_cache_pipeline(
+            cache,
+            llm,
+            expected_down_frames=[
+                LLMFullResponseStartFrame,
+                LLMTextFrame,
+                LLMTextFrame,
+                LLMFullResponseEndFrame,
+            ],
+        )
+
+        assert llm.calls == 1
+        key = build_cache_key(_context("Hello world"))
+        assert key is not None
+        assert cache.get(key) == "Hello world."
+
+    def test_errored_response_is_not_cached(self) -> None:
+        """A response whose error is reported after the end frame is not cached."""
+        cache = DictationResponseCache()
+        llm = FakeLLMService(["Hello"], failure="error")
+
+        _run_cache_pipeline(
+            cache,
+            llm,
+            expected_down_frames=_RESPONSE_FRAMES,
+            expected_up_frames=[ErrorFrame],
+        )
+
+        key = build_cache_key(_context("hello world"))
+        assert key is not None
+        assert cache.get(key) is None
+
+    def test_timed_out_response_is_not_cached(self) -> None:
+        """A completion timeout (no ErrorFrame) discards the response."""
+        cache = DictationResponseCache()
+        llm = FakeLLMService(["Hello"], failure="timeout")
+
+        _run_cache_pipeline(cache, llm, expected_down_frames=_RESPONSE_FRAMES)
+
+        key = build_cache_key(_context("hello world"))
+        assert key is not None
+        assert cache.get(key) is None
+
+    def test_error_from_other_processor_keeps_response(self) -> None:
+        """An ErrorFrame that doesn't come from an LLM service leaves the cache alone."""
+        cache = DictationResponseCache()
+        llm = FakeLLMService(["Hello world."])
+
+        _run_cache_pipeline(
+            cache,
+            llm,
+            expected_down_frames=_RESPONSE_FRAMES,
+            expected_up_frames=[ErrorFrame],
+            # Give the error time to travel upstream before the pipeline ends
+            frames_to_send=[LLMContextFrame(context=_context("hello world")), SleepFrame()],
+            downstream=[ErrorAfterProcessor()],
+        )
+
+        key = build_cache_key(_context("hello world"))
+        assert key is not None
+        assert cache.get(key) == "Hello world."
+
+    def test_empty_response_is_not_cached(self) -> None:
+        """A whitespace-only response is not cached."""
+        cache = DictationResponseCache()
+        llm = FakeLLMService(["  "])
+
+        _run_cache_pipeline(cache, llm, expected_down_frames=_RESPONSE_FRAMES)
+
+        key = build_cache_key(_context("hello world"))
+        assert key is not None
+        assert cache.get(key) is None
+
+    def test_discarded_key_is_cached_again_after_resend(self) -> None:
+        """A key discarded after a failure can be cached by a later successful response."""
+        cache = DictationResponseCache()
+        cache.discard("key")
+        cache.put("key", "Ignored.")
+        assert cache.get("key") is None
+
+        cache.mark_pending("key")
+        cache.put("key", "Cached.")
+        assert cache.get("key") == "Cached."
+
+    def test_discarded_keys_are_bounded(self) -> None:
+        """Failed keys that are never re-sent are forgotten like cache entries."""
+        cache = DictationResponseCache(max_size=2)
+        cache.discard("a")
+        cache.discard("b")
+        cache.discard("c")
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+
+    def test_clear_drops_all_entries(self) -> None:
+        """Clearing (e.g., on LLM provider switch) drops every cached response."""
+        cache = DictationResponseCache()
+        cache.put("a", "A")
+        cache.clear()
+        assert cache.get("a") is None
@@ -0,0 +1,76 @@
+"""Tests for TurnController handling of transcriptions without content."""
+
+import asyncio
+
+from pipecat.frames.frames import TranscriptionFrame
+from pipecat.processors.frame_processor import FrameDirection
+
+from processors.context_manager import DictationContextManager
+from processors.turn_controller import DrainingState, RecordingState, TurnController
+
+
+def _transcription(text: str) -> TranscriptionFrame:
+    return TranscriptionFrame(text, "user", "2026-01-01T00:00:00.000+00:00")
+
+
+class TestDroppedTranscriptions:
+    """Tests for filler-only and whitespace-only transcriptions."""
+
+    def test_filler_only_does_not_mark_content_while_recording(self) -> None:
+        """A filler-only transcription leaves the recording without content."""
+
+        async def run() -> TurnController:
+            controller = TurnController()
+            controller._state = RecordingState()
+            await controller.process_frame(_transcription("Um, uh..."), FrameDirection.DOWNSTREAM)
+            return controller
+
+        controller = asyncio.run(run())
+        assert controller._state == RecordingState(has_content=False)
+
+    def test_filler_only_extends_draining_without_marking_content(self) -> None:
+        """A late filler-only transcription still resets the drain timer."""
+
+        async def run() -> TurnController:
+            controller = TurnController()
+            controller._state = DrainingState(
+                has_content=False, direction=FrameDirection.DOWNSTREAM
+            )
+            await controller.process_frame(_transcription("um"), FrameDirection.DOWNSTREAM)
+            return controller
+
+        controller = asyncio.run(run())
+        assert controller._draining_event.is_set()
+        assert controller._state == DrainingState(
+            has_content=False, direction=FrameDirection.DOWNSTREAM
+        )
+
+    def test_whitespace_only_extends_draining_without_marking_content(self) -> None:
+        """A late whitespace-only transcription behaves like a filler-only one."""
+
+        async def run() -> TurnController:
+            controller = TurnController()
+            controller._state = DrainingState(has_content=True, direction=FrameDirection.DOWNSTREAM)
+            await controller.process_frame(_transcription("  "), FrameDirection.DOWNSTREAM)
+            return controller
+
+        controller = asyncio.run(run())
+        assert controller._draining_event.is_set()
+        assert controller._state == DrainingState(
+            has_content=True, direction=FrameDirection.DOWNSTREAM
+        )
+
+    def test_filler_only_is_kept_with_custom_main_prompt(self) -> None:
+        """A custom main prompt may keep fillers, so they are passed to the aggregator."""
+
+        async def run() -> TurnController:
+            context_manager = DictationContextManager()
+            context_manager.set_prompt_sections(main_custom="Keep every word verbatim.")
+            controller = TurnController()
+            controller.set_context_manager(context_manager)
+            controller._state = RecordingState()
+            await controller.process_frame(_transcription("um"), FrameDirection.DOWNSTREAM)
+            return controller
+
+        controller = asyncio.run(run())
+        assert controller._state == RecordingState(has_content=True)
@@ -43,7 +43,7 @@ class PipelineLogObserver(BaseObserver):
     def __init__(self) -> None:
         """Initialize the observer."""
         super().__init__()
-        self._llm_accumulator: str = ""
+        self._llm_accumulator: list[str] = []
         self._is_accumulating: bool = False
         self._audio_frame_count: int = 0
         # Track speaking state to deduplicate speech events from multiple sources
@@ -90,17 +90,19 @@ class PipelineLogObserver(BaseObserver):
             # Accumulate and log LLM response from LLM service
             # Use LLMTextFrame (not TextFrame) - this is what LLM services output
             case (LLMFullResponseStartFrame(), LLMService()):
-                self._llm_accumulator = ""
+                self._llm_accumulator = []
                 self._is_accumulating = True
 
             case (LLMTextFrame() as f, LLMService()) if self._is_accumulating:
-                self._llm_accumulator += f.text
+                self._llm_accumulator.append(f.text)
 
             case (LLMFullResponseEndFrame(), LLMService()):
                 self._is_accumulating = False
-                if self._llm_accumulator.strip():
-                    logger.info(f"Cleaned text: '{self._llm_accumulator.strip()}'")
-                self._llm_accumulator = ""
+                # Join once at the end instead of concatenating per token
+                cleaned_text = "".join(self._llm_accumulator).strip()
+                if cleaned_text:
+                    logger.info(f"Cleaned text: '{cleaned_text}'")
+                self._llm_accumulator.clear()
 
             # Log RTVI server messages when sent from output transport
             case (RTVIServerMessageFrame() as f, BaseOutputTransport()):
@@ -110,4 +112,6 @@ class PipelineLogObserver(BaseObserver):
             case _ if not isinstance(
                 frame, UserSpeakingFrame | MetricsFrame | TextFrame | LLMTextFrame
             ):
-                logger.debug(f"Frame: {type(frame).__name__}")
+                # Runs for nearly every frame push; defer formatting to loguru so
+                # nothing is built when DEBUG is filtered out
+                logger.debug("Frame: {}", type(frame).__name__)